@@ -1,42 +1,99 @@
-import yfinance as yf
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 from loguru import logger
+import argparse
+import hashlib
+import json
+import os
 import sys
+import time
 
-# -----------------------------------------------------
-# 1. Setup logging
-# -----------------------------------------------------
-logger.remove()
-logger.add(sys.stdout, level="INFO")
-logger.add("analysis.log", rotation="10 MB")
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    # Numba is optional; without it the kernels below run as plain Python loops,
+    # which PyPy's tracing JIT compiles natively
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+CACHE_DIR = os.path.expanduser("~/.cache/dkng")
+INFO_TTL = 24 * 60 * 60  # seconds
+SMA_WINDOWS = (20, 50, 200)
 
 # -----------------------------------------------------
-# 2. CLI Argument: choose ticker
+# 1. Fetch market data (cached on disk per ticker/date range)
 # -----------------------------------------------------
-if len(sys.argv) > 1:
-    ticker = sys.argv[1].upper()
-else:
-    ticker = "DKNG"
+def cache_path(*parts, ext="parquet"):
+    key = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.{ext}")
 
-logger.info(f"Starting {ticker} stock analysis")
+def atomic_write(path, write):
+    # Write next to the target and rename, so an interrupted write never leaves a corrupt cache file
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
 
-end_date = datetime.today()
-start_date = end_date - timedelta(days=730)
+def missing_tickers(df, tickers):
+    # yfinance keeps a failed ticker as an all-NaN column group rather than dropping it
+    if df.empty or not isinstance(df.columns, pd.MultiIndex):
+        return tickers if df.empty else []
+    present = df.columns.get_level_values(0)
+    return [t for t in tickers if t not in present or df[t].isna().all().all()]
 
-# -----------------------------------------------------
-# 3. Fetch market data
-# -----------------------------------------------------
-logger.info(f"Fetching {ticker} data from {start_date.date()} to {end_date.date()}...")
-dkng = yf.download(ticker, start=start_date, end=end_date, progress=False)
-spy = yf.download("SPY", start=start_date, end=end_date, progress=False)
+def cached_download(tickers, start, end):
+    # One threaded request for all tickers, grouped as (ticker, field) columns
+    tickers = list(dict.fromkeys(tickers))
+    path = cache_path(",".join(tickers), start, end)
+    if os.path.exists(path):
+        logger.info(f"Loading {', '.join(tickers)} from cache ({path})")
+        return pd.read_parquet(path, engine="pyarrow")
+    import yfinance as yf
+    # yfinance treats `end` as exclusive midnight; ask for the next day so `end` itself is included
+    df = yf.download(tickers, start=start, end=end + timedelta(days=1), group_by="ticker",
+                     threads=True, progress=False)
+    # Only closing prices are used downstream; drop Open/High/Low/Volume before caching
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.loc[:, [c for c in df.columns if "close" in c[-1].lower()]]
+    missing = missing_tickers(df, tickers)
+    if missing:
+        logger.warning(f"No data for {', '.join(missing)}; not caching this download")
+    else:
+        atomic_write(path, lambda tmp: df.to_parquet(tmp, engine="pyarrow"))
+    return df
+
+def cached_info(ticker):
+    path = os.path.join(CACHE_DIR, f"{ticker}_info.json")
+    if os.path.exists(path) and time.time() - os.path.getmtime(path) < INFO_TTL:
+        with open(path) as f:
+            return json.load(f)
+    import yfinance as yf
+    info = yf.Ticker(ticker).info
+
+    def write(tmp):
+        with open(tmp, "w") as f:
+            json.dump(info, f)
+
+    atomic_write(path, write)
+    return info
 
 # -----------------------------------------------------
-# 4. Flatten yfinance MultiIndex columns
+# 2. Flatten yfinance MultiIndex columns
 # -----------------------------------------------------
-def flatten_yf_columns(df):
+def flatten_yf_columns(df, ticker=None):
+    if isinstance(df.columns, pd.MultiIndex) and ticker in df.columns.get_level_values(0):
+        df = df[ticker].copy()
     if isinstance(df.columns, pd.MultiIndex):
         df.columns = ['_'.join(col).strip() if isinstance(col, tuple) else col for col in df.columns]
     close_cols = [c for c in df.columns if "close" in c.lower()]
@@ -44,108 +101,348 @@ def flatten_yf_columns(df):
         df.rename(columns={close_cols[0]: "Close"}, inplace=True)
     return df
 
-dkng = flatten_yf_columns(dkng)
-spy = flatten_yf_columns(spy)
+def load_prices(data, ticker):
+    df = flatten_yf_columns(data, ticker)
+    if "Close" not in df.columns:
+        raise KeyError(f"'Close' column not found in {ticker} data. Columns: {df.columns.tolist()}")
+    # A multi-ticker download is outer-joined on dates; drop the days this ticker didn't trade
+    df = df[["Close"]].dropna()
+    if df.empty:
+        raise ValueError(f"No {ticker} prices in the downloaded range")
+    # Prices carry ~5 significant figures; float32 halves memory for the working column
+    return df.astype(np.float32)
 
-if "Close" not in dkng.columns:
-    raise KeyError(f"'Close' column not found in {ticker} data. Columns: {dkng.columns.tolist()}")
+# -----------------------------------------------------
+# 3. Indicator kernels (batched: one row per ticker, one column per day)
+# -----------------------------------------------------
+def daily_returns(close):
+    ret = np.empty_like(close)
+    ret[..., 0] = np.nan
+    np.divide(close[..., 1:], close[..., :-1], out=ret[..., 1:])
+    ret[..., 1:] -= 1.0
+    return ret
+
+def cumulative_returns(returns):
+    # prod(1 + r) - 1 as a cumulative sum of log returns; NaN padding and the first return count as 0
+    return np.expm1(np.nancumsum(np.log1p(returns[..., 1:].astype(np.float64)), axis=-1))
+
+# Rows may start with NaN padding (tickers with shorter histories); kernels start at the first price
+@njit("i8(f4[:])", cache=True)
+def first_valid(row):
+    i = 0
+    while i < row.shape[0] and np.isnan(row[i]):
+        i += 1
+    return i
+
+# RSI Calculation (Wilder smoothing)
+@njit("f4[:, :](f4[:, :], i8)", parallel=True, cache=True)
+def wilder_rsi(close, period):
+    n_tickers, n = close.shape
+    out = np.full((n_tickers, n), np.nan, dtype=close.dtype)
+    for t in prange(n_tickers):
+        start = first_valid(close[t])
+        if n - start <= period:
+            continue
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(start + 1, start + period + 1):
+            d = close[t, i] - close[t, i - 1]
+            if d > 0:
+                avg_gain += d
+            else:
+                avg_loss -= d
+        avg_gain /= period
+        avg_loss /= period
+        for i in range(start + period, n):
+            if i > start + period:
+                d = close[t, i] - close[t, i - 1]
+                avg_gain = (avg_gain * (period - 1) + max(d, 0.0)) / period
+                avg_loss = (avg_loss * (period - 1) + max(-d, 0.0)) / period
+            if avg_loss == 0:
+                out[t, i] = 100.0
+            else:
+                out[t, i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+# Moving Averages (all windows in one sliding-sum pass)
+@njit("f4[:, :, :](f4[:, :], UniTuple(i8, 3))", parallel=True, cache=True)
+def sma_multi(close, windows):
+    n_tickers, n = close.shape
+    out = np.full((n_tickers, n, len(windows)), np.nan, dtype=close.dtype)
+    for t in prange(n_tickers):
+        start = first_valid(close[t])
+        for k in range(len(windows)):
+            w = windows[k]
+            total = 0.0
+            for i in range(start, n):
+                total += close[t, i]
+                if i - start >= w:
+                    total -= close[t, i - w]
+                if i - start >= w - 1:
+                    out[t, i, k] = total / w
+    return out
+
+# MACD (EMAs, signal line and histogram in one pass)
+@njit("UniTuple(f4[:, :], 3)(f4[:, :], i8, i8, i8)", parallel=True, cache=True)
+def macd_fused(close, s1, s2, sig):
+    n_tickers, n = close.shape
+    out_macd = np.full_like(close, np.nan)
+    out_sig = np.full_like(close, np.nan)
+    out_hist = np.full_like(close, np.nan)
+    a1 = 2.0 / (s1 + 1)
+    a2 = 2.0 / (s2 + 1)
+    a3 = 2.0 / (sig + 1)
+    for t in prange(n_tickers):
+        start = first_valid(close[t])
+        if start == n:
+            continue
+        e1 = close[t, start]
+        e2 = close[t, start]
+        m_sig = 0.0
+        for i in range(start, n):
+            c = close[t, i]
+            e1 = a1 * c + (1 - a1) * e1
+            e2 = a2 * c + (1 - a2) * e2
+            macd = e1 - e2
+            m_sig = a3 * macd + (1 - a3) * m_sig
+            out_macd[t, i] = macd
+            out_sig[t, i] = m_sig
+            out_hist[t, i] = macd - m_sig
+    return out_macd, out_sig, out_hist
+
+# Drawdown (running peak of Close, streamed once)
+@njit("f8[:](f4[:, :])", parallel=True, cache=True)
+def compute_max_drawdown(close):
+    n_tickers, n = close.shape
+    out = np.zeros(n_tickers)
+    for t in prange(n_tickers):
+        peak = close[t, 0]
+        mdd = 0.0
+        seen = False
+        for i in range(n):
+            x = close[t, i]
+            if np.isnan(x):
+                continue
+            if not seen or x > peak:
+                peak = x
+                seen = True
+            dd = x / peak - 1.0
+            if dd < mdd:
+                mdd = dd
+        # A row with no prices has no drawdown, not a 0% one
+        out[t] = mdd if seen else np.nan
+    return out
 
 # -----------------------------------------------------
-# 5. Compute daily returns and indicators
+# 4. Compute indicators and performance stats
 # -----------------------------------------------------
-dkng["Daily_Return"] = dkng["Close"].pct_change()
-spy["Daily_Return"] = spy["Close"].pct_change()
+def compute_indicators(df, close_np):
+    batch = close_np[np.newaxis, :]
+    df["Daily_Return"] = daily_returns(close_np)
+    df["RSI"] = pd.Series(wilder_rsi(batch, 14)[0], index=df.index)
+
+    sma = sma_multi(batch, SMA_WINDOWS)[0]
+    for k, w in enumerate(SMA_WINDOWS):
+        df[f"SMA_{w}"] = pd.Series(sma[:, k], index=df.index)
 
-# RSI Calculation
-def compute_rsi(series, window=14):
-    delta = series.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
+    macd, signal_line, macd_hist = macd_fused(batch, 12, 26, 9)
+    df["MACD"] = pd.Series(macd[0], index=df.index)
+    df["Signal_Line"] = pd.Series(signal_line[0], index=df.index)
+    df["MACD_Hist"] = pd.Series(macd_hist[0], index=df.index)
 
-dkng["RSI"] = compute_rsi(dkng["Close"])
+    df["Volatility"] = df["Daily_Return"].rolling(window=20).std() * np.sqrt(252)
+    return df
 
-# Moving Averages
-dkng["SMA_20"] = dkng["Close"].rolling(window=20).mean()
-dkng["SMA_50"] = dkng["Close"].rolling(window=50).mean()
-dkng["SMA_200"] = dkng["Close"].rolling(window=200).mean()
+def analyze(df, spy, close_np):
+    returns_f8 = df["Daily_Return"].astype(np.float64)
+    returns_std = returns_f8.std()
+    sharpe_ratio = (
+        returns_f8.mean() / returns_std * np.sqrt(252)
+        if returns_std != 0 else np.nan
+    )
+    cum_return = cumulative_returns(df["Daily_Return"].to_numpy())
+    spy_cum_return = cumulative_returns(spy["Daily_Return"].to_numpy())
+    relative_performance = (1 + cum_return[-1]) / (1 + spy_cum_return[-1]) - 1
+    last_year = close_np[-252:]
+    return {
+        "price": close_np[-1],
+        "high_52w": last_year.max(),
+        "low_52w": last_year.min(),
+        "sharpe_ratio": sharpe_ratio,
+        "max_drawdown": float(compute_max_drawdown(close_np[np.newaxis, :])[0]),
+        "relative_performance": relative_performance,
+    }
 
-# MACD
-exp1 = dkng["Close"].ewm(span=12, adjust=False).mean()
-exp2 = dkng["Close"].ewm(span=26, adjust=False).mean()
-dkng["MACD"] = exp1 - exp2
-dkng["Signal_Line"] = dkng["MACD"].ewm(span=9, adjust=False).mean()
+def screen(data, tickers):
+    # One row per ticker through the batched kernels. Each row holds only that ticker's own
+    # history, right-aligned and NaN-padded on the left, so its stats don't depend on the
+    # other symbols in the batch and the last column is always its latest close.
+    symbols = list(dict.fromkeys(tickers + ["SPY"]))
+    series, missing = {}, []
+    for t in symbols:
+        try:
+            series[t] = load_prices(data, t)["Close"]
+        except ValueError:
+            missing.append(t)
+    if "SPY" in missing:
+        raise KeyError("No SPY data to benchmark against")
+    if all(t in missing for t in tickers):
+        raise ValueError(f"No price data for any of {', '.join(tickers)}")
+    if missing:
+        logger.warning(f"No data for {', '.join(missing)}; skipping")
 
-# Volatility & Sharpe
-dkng["Volatility"] = dkng["Daily_Return"].rolling(window=20).std() * np.sqrt(252)
-sharpe_ratio = (
-    dkng["Daily_Return"].mean() / dkng["Daily_Return"].std() * np.sqrt(252)
-    if dkng["Daily_Return"].std() != 0 else np.nan
-)
+    n_days = max(len(c) for c in series.values())
+    close_np = np.full((len(series), n_days), np.nan, dtype=np.float32)
+    for row, c in enumerate(series.values()):
+        close_np[row, n_days - len(c):] = c.to_numpy()
+    returns = daily_returns(close_np)
+    returns_f8 = returns[:, 1:].astype(np.float64)
+    returns_std = np.nanstd(returns_f8, axis=1, ddof=1)
+    cum_return = cumulative_returns(returns)[:, -1]
+    spy_cum_return = cum_return[list(series).index("SPY")]
+    sma = sma_multi(close_np, SMA_WINDOWS)[:, -1, :]
+    _, _, macd_hist = macd_fused(close_np, 12, 26, 9)
 
-# Drawdown
-dkng["Cumulative"] = (1 + dkng["Daily_Return"]).cumprod()
-dkng["Cum_Max"] = dkng["Cumulative"].cummax()
-dkng["Drawdown"] = dkng["Cumulative"] / dkng["Cum_Max"] - 1
-max_drawdown = dkng["Drawdown"].min()
+    table = pd.DataFrame({
+        "Price": close_np[:, -1],
+        "RSI": wilder_rsi(close_np, 14)[:, -1],
+        **{f"SMA_{w}": sma[:, k] for k, w in enumerate(SMA_WINDOWS)},
+        "MACD_Hist": macd_hist[:, -1],
+        "Sharpe": np.where(returns_std != 0, np.nanmean(returns_f8, axis=1) / returns_std * np.sqrt(252), np.nan),
+        "Max_Drawdown": compute_max_drawdown(close_np),
+        "Rel_vs_SPY": (1 + cum_return) / (1 + spy_cum_return) - 1,
+    }, index=list(series))
+    return table.loc[[t for t in tickers if t not in missing]]
 
 # -----------------------------------------------------
-# 6. Fundamentals
+# 5. Fundamentals
 # -----------------------------------------------------
-logger.info("Fetching fundamental 10-K data...")
-try:
-    info = yf.Ticker(ticker).info
-    market_cap = info.get("marketCap")
-    pe_ratio = info.get("trailingPE")
-    eps = info.get("trailingEps")
-    sector = info.get("sector")
-except Exception as e:
-    logger.warning(f"Fundamentals unavailable: {e}")
-    market_cap = pe_ratio = eps = sector = None
-
-# -----------------------------------------------------
-# 7. Performance vs SPY
-# -----------------------------------------------------
-relative_performance = (
-    (dkng["Cumulative"].iloc[-1] /
-     spy["Close"].pct_change().add(1).cumprod().iloc[-1]) - 1
-)
-
-# -----------------------------------------------------
-# 8. Print summary
-# -----------------------------------------------------
-logger.info("=" * 60)
-logger.info(f"STOCK ANALYSIS - {ticker}")
-logger.info("=" * 60)
-
-logger.info(f"Current Price: ${dkng['Close'].iloc[-1]:.2f}")
-logger.info(f"52-Week High: ${dkng['Close'].tail(252).max():.2f}")
-logger.info(f"52-Week Low:  ${dkng['Close'].tail(252).min():.2f}")
-logger.info(f"Sharpe Ratio: {sharpe_ratio:.2f}")
-logger.info(f"Max Drawdown: {max_drawdown:.2%}")
-logger.info(f"Relative Performance vs SPY: {relative_performance:.2%}")
-
-if market_cap:
-    logger.info(f"Market Cap: ${market_cap:,.0f}")
-if pe_ratio:
-    logger.info(f"P/E Ratio: {pe_ratio:.2f}")
-if eps:
-    logger.info(f"EPS: {eps:.2f}")
-if sector:
-    logger.info(f"Sector: {sector}")
-
-# -----------------------------------------------------
-# 9. Visualization
-# -----------------------------------------------------
-plt.figure(figsize=(12, 6))
-plt.plot(dkng.index, dkng["Close"], label="Close Price", linewidth=1.8)
-plt.plot(dkng.index, dkng["SMA_50"], label="50-Day SMA", linestyle="--")
-plt.plot(dkng.index, dkng["SMA_200"], label="200-Day SMA", linestyle="--")
-plt.title(f"{ticker} Price with Moving Averages")
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-logger.info("Analysis complete.")
+def fetch_fundamentals(ticker):
+    logger.info("Fetching fundamental 10-K data...")
+    try:
+        info = cached_info(ticker)
+    except Exception as e:
+        logger.warning(f"Fundamentals unavailable: {e}")
+        info = {}
+    return {
+        "market_cap": info.get("marketCap"),
+        "pe_ratio": info.get("trailingPE"),
+        "eps": info.get("trailingEps"),
+        "sector": info.get("sector"),
+    }
+
+# -----------------------------------------------------
+# 6. Print summary
+# -----------------------------------------------------
+def print_summary(ticker, stats, fundamentals):
+    logger.info("=" * 60)
+    logger.info(f"STOCK ANALYSIS - {ticker}")
+    logger.info("=" * 60)
+
+    logger.info(f"Current Price: ${stats['price']:.2f}")
+    logger.info(f"52-Week High: ${stats['high_52w']:.2f}")
+    logger.info(f"52-Week Low:  ${stats['low_52w']:.2f}")
+    logger.info(f"Sharpe Ratio: {stats['sharpe_ratio']:.2f}")
+    logger.info(f"Max Drawdown: {stats['max_drawdown']:.2%}")
+    logger.info(f"Relative Performance vs SPY: {stats['relative_performance']:.2%}")
+
+    if fundamentals.get("market_cap"):
+        logger.info(f"Market Cap: ${fundamentals['market_cap']:,.0f}")
+    if fundamentals.get("pe_ratio"):
+        logger.info(f"P/E Ratio: {fundamentals['pe_ratio']:.2f}")
+    if fundamentals.get("eps"):
+        logger.info(f"EPS: {fundamentals['eps']:.2f}")
+    if fundamentals.get("sector"):
+        logger.info(f"Sector: {fundamentals['sector']}")
+
+def print_screen(table):
+    logger.info("=" * 60)
+    logger.info(f"SCREENER - {len(table)} tickers vs SPY")
+    logger.info("=" * 60)
+    pct = "{:.2%}".format
+    text = table.to_string(float_format="{:.2f}".format,
+                           formatters={"Max_Drawdown": pct, "Rel_vs_SPY": pct})
+    for line in text.splitlines():
+        logger.info(line)
+
+# -----------------------------------------------------
+# 7. Visualization
+# -----------------------------------------------------
+def plot(ticker, df):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    # ~200 evenly spaced points render the same at this size for a fraction of the cost
+    idx = np.linspace(0, len(df) - 1, min(200, len(df))).astype(int)
+    dates = df.index[idx]
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.plot(dates, df["Close"].to_numpy()[idx], label="Close Price", linewidth=1.8)
+    ax.plot(dates, df["SMA_50"].to_numpy()[idx], label="50-Day SMA", linestyle="--")
+    ax.plot(dates, df["SMA_200"].to_numpy()[idx], label="200-Day SMA", linestyle="--")
+    ax.set_title(f"{ticker} Price with Moving Averages")
+    ax.legend()
+    ax.grid(True)
+    fig.tight_layout()
+    chart_path = f"{ticker.lower()}_analysis.png"
+    fig.savefig(chart_path, dpi=90, bbox_inches="tight")
+    plt.close(fig)
+    logger.info(f"Chart saved to {chart_path}")
+
+# -----------------------------------------------------
+# 8. Entry point
+# -----------------------------------------------------
+def parse_args():
+    parser = argparse.ArgumentParser(description="Stock analysis with technical indicators vs SPY")
+    parser.add_argument("ticker", nargs="?", default="DKNG", help="ticker symbol (default: DKNG)")
+    parser.add_argument("--no-plot", dest="plot", action="store_false",
+                        help="print the summary only; skips importing matplotlib")
+    parser.add_argument("--fundamentals", action="store_true",
+                        help="also report market cap, P/E, EPS and sector (slow Ticker.info scrape, cached 24h)")
+    parser.add_argument("--tickers",
+                        help="comma-separated tickers to screen in one batch, e.g. AAPL,MSFT,DKNG")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    ticker = args.ticker.upper()
+
+    logger.remove()
+    logger.add(sys.stdout, level="INFO")
+    logger.add("analysis.log", rotation="10 MB")
+    logger.debug(f"Indicator kernels: {'numba' if HAS_NUMBA else 'pure Python'} ({sys.implementation.name})")
+
+    end_date = datetime.today()
+    start_date = end_date - timedelta(days=730)
+
+    if args.tickers:
+        tickers = list(dict.fromkeys(t.strip().upper() for t in args.tickers.split(",") if t.strip()))
+        logger.info(f"Screening {', '.join(tickers)} from {start_date.date()} to {end_date.date()}...")
+        data = cached_download(tickers + ["SPY"], start_date.date(), end_date.date())
+        print_screen(screen(data, tickers))
+        logger.info("Screening complete.")
+        return
+
+    logger.info(f"Starting {ticker} stock analysis")
+
+    # Ticker and benchmark come from one shared download
+    logger.info(f"Fetching {ticker} data from {start_date.date()} to {end_date.date()}...")
+    data = cached_download([ticker, "SPY"], start_date.date(), end_date.date())
+    dkng = load_prices(data, ticker)
+    close_np = np.ascontiguousarray(dkng["Close"].to_numpy(dtype=np.float32))
+    dkng = compute_indicators(dkng, close_np)
+    spy = load_prices(data, "SPY")
+    spy["Daily_Return"] = daily_returns(spy["Close"].to_numpy())
+
+    stats = analyze(dkng, spy, close_np)
+    fundamentals = fetch_fundamentals(ticker) if args.fundamentals else {}
+    print_summary(ticker, stats, fundamentals)
+
+    if args.plot:
+        plot(ticker, dkng)
+
+    logger.info("Analysis complete.")
+
+if __name__ == "__main__":
+    main()